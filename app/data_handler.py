@@ -8,12 +8,14 @@ with a Natural Earth world-countries shapefile.
 The pipeline is organized into:
 1) Data models (Pydantic)
 2) Data downloading and processing (pandas/geopandas)
+3) Query helpers on the merged data (`select_extremes`)
 
 Why it works this way
 ---------------------
-- **Idempotency:** downloads are skipped if files already exist locally. This makes
-  reruns safe and fast (same inputs → same stored artifacts) and prevents unnecessary
-  network calls.
+- **Idempotency:** downloads are skipped if files already exist locally and the server
+  confirms they are unchanged (conditional GET against the ETag/Last-Modified recorded
+  in `downloads/.manifest.json`). This makes reruns safe and fast (same inputs → same
+  stored artifacts) and prevents unnecessary transfers.
 - **"Most recent" snapshot:** when a dataset includes a "Year" column, the pipeline
   keeps the latest year per country. This aligns the dashboard with "current" values
   rather than historical time series.
@@ -23,7 +25,8 @@ Why it works this way
 
 Notes
 -----
-- CSV sources are downloaded once into a local directory and reused on subsequent runs.
+- CSV sources are downloaded once into a local directory and reused on subsequent runs
+  for as long as the server reports them unchanged.
 - OWID datasets are reduced to a single (most recent) record per country code when a
   "Year" column is present.
 - Geospatial joins are performed using the Natural Earth 3-letter country code field
@@ -32,10 +35,15 @@ Notes
 
 Dependencies
 ------------
-os, zipfile, requests
-pandas, geopandas
+hashlib, json, os, threading, concurrent.futures
+requests, urllib3
+numpy, pandas, geopandas, pyogrio, pyarrow
 pydantic
 
+geopandas (and with it GDAL/pyogrio and shapely) is imported lazily where a
+GeoDataFrame is first read, so importing this module, e.g. for `DataSource`
+or `project_sources`, stays cheap.
+
 Examples
 --------
 Instantiate the data handler in Python:
@@ -46,13 +54,74 @@ Instantiate the data handler in Python:
 True
 """
 
+import hashlib
+import json
 import os
-import zipfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 import pandas as pd
-import geopandas as gpd
 from pydantic import BaseModel, HttpUrl, Field
-from typing import Optional, Dict
+from typing import TYPE_CHECKING, Optional, Dict
+
+if TYPE_CHECKING:
+    import geopandas as gpd
+
+
+def _copy_and_hash(src, dst, chunk_size: int = 1024 * 1024) -> tuple[str, int]:
+    """
+    Copy a binary stream to another while computing its SHA-256 digest.
+
+    Args:
+        src: Readable binary file-like object (e.g. `response.raw`).
+        dst: Writable binary file-like object.
+        chunk_size (int): Bytes read per iteration. Defaults to 1 MiB, which
+            keeps the Python-level loop and `write()` calls rare on fast links.
+
+    Returns:
+        tuple[str, int]: Hex digest and total number of bytes copied.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    while True:
+        chunk = src.read(chunk_size)
+        if not chunk:
+            break
+        digest.update(chunk)
+        dst.write(chunk)
+        size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def _write_parquet_atomic(frame: pd.DataFrame, path: str, **kwargs) -> None:
+    """
+    Write `frame` to `path` as Parquet without ever leaving a partial file.
+
+    The file is written to `<path>.tmp` and moved into place with
+    `os.replace`, so an interrupted write (killed process, full disk) keeps
+    any previous `path` intact instead of truncating it.
+
+    Args:
+        frame (pd.DataFrame): DataFrame or GeoDataFrame to write.
+        path (str): Destination path.
+        **kwargs: Passed on to `frame.to_parquet`.
+
+    Returns:
+        None
+    """
+    tmp_path = path + ".tmp"
+    try:
+        frame.to_parquet(tmp_path, **kwargs)
+        os.replace(tmp_path, path)
+    finally:
+        # Only left behind when the write failed.
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
 
 class DataSource(BaseModel):
@@ -108,24 +177,44 @@ class OkavangoData:
             Should include one shapefile source and one or more CSV metric
             sources.
         download_dir (str): Directory where downloaded artifacts are stored
-            (CSV files and shapefile zip). Defaults to "downloads".
+            (CSV files and the shapefile zip). Defaults to "downloads".
 
     Attributes:
         sources (list[DataSource]): The configured list of sources.
         download_dir (str): Base directory for persisted downloads.
-        shapefile_dir (str): Directory where the shapefile zip is extracted.
+        shapefile_zip (str): Local copy of the zipped Natural Earth shapefile.
+        shapefile_path (str): GDAL `/vsizip/` path of the .shp inside
+            `shapefile_zip`, read in place without extracting the archive.
+        geoparquet_path (str): GeoParquet copy of the shapefile, (re)built
+            on load whenever it is missing, unreadable, or older than
+            `shapefile_zip`, and preferred over the .shp otherwise.
         dataframes (dict[str, pd.DataFrame]): Mapping from CSV filename to
-            its cleaned DataFrame. Each includes "Code" (normalized country
-            identifier) and metric columns (excludes "Year"/"Entity"/"Country"
-            when present).
+            its cleaned DataFrame. Each is indexed by "Code" (normalized
+            country identifier) and holds the metric columns (excludes
+            "Year"/"Entity"/"Country" when present).
         geo_dataframe (gpd.GeoDataFrame or None): GeoDataFrame loaded from
             the Natural Earth shapefile.
         merged_data (gpd.GeoDataFrame or None): World GeoDataFrame with all
             metric columns merged in.
+        manifest_path (str): JSON file mapping each source URL to the
+            validators (ETag, Last-Modified) and checksum of its download.
+        MAX_DOWNLOAD_WORKERS (int): Upper bound on concurrent downloads.
+        DOWNLOAD_RETRY (Retry): Retry policy of the shared HTTP session:
+            connection errors and 502/503/504 responses are retried up to
+            three times with exponential backoff before the download fails.
+        SHAPEFILE_COLUMNS (list[str]): Natural Earth attribute fields read
+            alongside the geometry (join keys and display names); the other
+            ~160 fields are never decoded.
+        SIMPLIFY_TOLERANCE (float): Douglas-Peucker tolerance (degrees)
+            applied to the merged geometries. 0.1° is below one pixel on the
+            dashboard's world-zoom map and trims the GeoJSON sent to the
+            browser on every render.
 
     Note:
         - Initialization performs the full pipeline (download → load/clean →
-          merge).
+          merge) unless `auto_run=False`. The merged layer is cached as
+          GeoParquet keyed by the download manifest, so the merge only
+          reruns after a source has actually changed.
         - CSV cleaning attempts to infer a geographic key column by searching
           for "code"/"iso", and if none, falling back to "entity"/"country"/
           "name".
@@ -137,15 +226,34 @@ class OkavangoData:
         >>> isinstance(handler.merged_data, gpd.GeoDataFrame)
         True
     """
-    def __init__(self, sources: list[DataSource], download_dir: str = "downloads"):
+
+    MAX_DOWNLOAD_WORKERS = 8
+    DOWNLOAD_RETRY = Retry(
+        total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]
+    )
+    MANIFEST_FILENAME = ".manifest.json"
+    SIMPLIFY_TOLERANCE = 0.1
+    SHAPEFILE_COLUMNS = ["ADM0_A3", "ISO_A3", "NAME", "ADMIN"]
+
+    def __init__(
+        self,
+        sources: list[DataSource],
+        download_dir: str = "downloads",
+        auto_run: bool = True,
+    ):
         """
         Initialize the data handler and run the full data preparation pipeline.
 
         Args:
             sources (list[DataSource]): List of configured sources to download
                 and process.
-            download_dir (str): Output directory for downloaded and extracted
+            download_dir (str): Output directory for downloaded and derived
                 data. Defaults to "downloads".
+            auto_run (bool): Whether to run the pipeline (download →
+                load/clean → merge) right away. Pass False to get a bare
+                handler, e.g. in tests that set `geo_dataframe` and
+                `dataframes` by hand; nothing is downloaded and no directory
+                is created. Defaults to True.
 
         Raises:
             OSError: If the download directory cannot be created.
@@ -160,32 +268,60 @@ class OkavangoData:
         """
         self.sources = sources
         self.download_dir = download_dir
-        self.shapefile_dir = os.path.join(self.download_dir, "ne_110m_admin_0_countries")
+        self.shapefile_zip = os.path.join(self.download_dir, "ne_110m_admin_0_countries.zip")
+        self.shapefile_path = (
+            f"/vsizip/{os.path.abspath(self.shapefile_zip)}/ne_110m_admin_0_countries.shp"
+        )
+        self.geoparquet_path = os.path.join(self.download_dir, "ne_110m_admin_0_countries.parquet")
         
         self.dataframes: Dict[str, pd.DataFrame] = {}
-        self.geo_dataframe: Optional[gpd.GeoDataFrame] = None
-        self.merged_data: Optional[gpd.GeoDataFrame] = None
+        self.geo_dataframe: Optional["gpd.GeoDataFrame"] = None
+        self.merged_data: Optional["gpd.GeoDataFrame"] = None
+        self.manifest_path = os.path.join(self.download_dir, self.MANIFEST_FILENAME)
+        self._manifest: Dict[str, dict] = self._read_manifest()
+        self._manifest_lock = threading.Lock()
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.MAX_DOWNLOAD_WORKERS,
+            pool_maxsize=self.MAX_DOWNLOAD_WORKERS,
+            max_retries=self.DOWNLOAD_RETRY,
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        if not auto_run:
+            return
 
-        os.makedirs(self.download_dir, exist_ok=True)
         self.download_project_data()
         self._load_and_clean_dataframes()
-        self.merge_geospatial_layers()
+
+        merged_cache_path = self._merged_cache_path()
+        if not self._read_merged_cache(merged_cache_path):
+            self.merge_geospatial_layers()
+            self._write_merged_cache(merged_cache_path)
 
     def download_project_data(self) -> None:
         """
         Downloads all configured project sources to the local filesystem.
 
-        This method iterates over `self.sources` and:
-        - For shapefiles: downloads a zip to `download_dir`, then extracts it
-          into `self.shapefile_dir` if not already present.
-        - For CSV files: downloads each CSV to `download_dir` under
+        This method submits every entry of `self.sources` to a thread pool
+        (see `_download_one`) so the independent, network-bound transfers
+        overlap instead of running back to back. For each source:
+        - For shapefiles: streams the zip to `self.shapefile_zip` if not
+          already present. Its GeoParquet copy is built on load (see
+          `_load_and_clean_dataframes`).
+        - For CSV files: streams each CSV straight to `download_dir` under
           `source.filename` if not already present.
 
         This method is intentionally **idempotent**: if the expected local
-        files already exist, it skips downloading them again. This:
+        files already exist and the server reports them unchanged (via the
+        ETag / Last-Modified validators stored in `self.manifest_path`), it
+        skips downloading them again. This:
         - reduces runtime and bandwidth usage,
         - makes reruns safe and predictable,
-        - aligns with the idempotency principle.
+        - aligns with the idempotency principle,
+        - refreshes stale or partially written files instead of trusting
+          their mere existence.
 
         Returns:
             None
@@ -197,37 +333,294 @@ class OkavangoData:
                 request-layer failures.
 
         Note:
-            - Downloads are skipped if the target file already exists locally.
-            - Shapefile extraction is performed after download completes.
+            - Downloads are skipped if the target file already exists locally
+              and the server answers the conditional request with 304.
+            - If revalidation fails (e.g. offline), existing local copies
+              are used as-is.
+            - The manifest is written once after all workers finish.
+            - The first exception raised by a worker is re-raised here.
 
         Example:
             >>> handler = OkavangoData(sources=project_sources)
             >>> handler.download_project_data()  # skip existing files
         """
 
+        if not self.sources:
+            return
+
+        os.makedirs(self.download_dir, exist_ok=True)
+        try:
+            max_workers = min(self.MAX_DOWNLOAD_WORKERS, len(self.sources))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(self._download_one, self.sources))
+        finally:
+            self._write_manifest()
+
+    def _download_one(self, source: DataSource) -> None:
+        """
+        Download a single project source.
+
+        This is the per-source unit of work submitted to the thread pool by
+        `download_project_data`. All workers share `self._session`, whose
+        adapter keeps up to `MAX_DOWNLOAD_WORKERS` keep-alive connections
+        per host, so the five OWID downloads reuse their TLS connections
+        instead of handshaking again or discarding them when the pool fills.
+
+        When a complete local copy exists (see `_is_cached_copy_valid`) and
+        the manifest holds validators for the URL, the request is sent as a
+        conditional GET (`If-None-Match` / `If-Modified-Since`). A `304 Not
+        Modified` answer has no body, so an unchanged source costs one round
+        trip and zero transferred bytes. If the server sent no validators,
+        the complete local copy is used without a request, as before the
+        manifest existed. A changed body is streamed to a `.part` file and
+        only replaces the local copy once fully received, so a failed
+        request or an interrupted transfer always leaves the previous copy
+        in place and in use.
+
+        Args:
+            source (DataSource): The source to download.
+
+        Returns:
+            None
+
+        Raises:
+            requests.HTTPError: If the server returns a non-success status
+                and no usable local copy exists.
+            requests.RequestException: For network issues, timeouts, or a
+                transfer interrupted mid-stream while no usable local copy
+                exists.
+        """
+        url_str = str(source.url)
+        if source.is_shapefile:
+            target_path = self.shapefile_zip
+            label = "shapefile"
+        else:
+            target_path = os.path.join(self.download_dir, source.filename)
+            label = source.filename
+
+        entry = self._manifest.get(url_str)
+        has_local_copy = bool(entry) and self._is_cached_copy_valid(target_path, entry)
+        headers = {}
+        if has_local_copy:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+            if not headers:
+                return
+
+        try:
+            response = self._session.get(
+                url_str, headers=headers, stream=True, timeout=(10, 60)
+            )
+            response.raise_for_status()
+        except requests.RequestException as exc:
+            if exc.response is not None:
+                exc.response.close()
+            if has_local_copy:
+                print(f"Could not revalidate {label} ({exc}); using local copy.")
+                return
+            raise
+
+        # Closing the streamed response hands its connection back to the
+        # session pool, including on the 304 path where the body is unread.
+        with response:
+            if response.status_code == 304:
+                return
+
+            print(f"Downloading {label}...")
+            try:
+                sha256, size = self._stream_to_file(response, target_path)
+            except requests.RequestException as exc:
+                if has_local_copy:
+                    print(f"Download of {label} failed ({exc}); using local copy.")
+                    return
+                raise
+
+        with self._manifest_lock:
+            self._manifest[url_str] = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "sha256": sha256,
+                "size": size,
+            }
+
+    @staticmethod
+    def _stream_to_file(
+        response: requests.Response, target_path: str
+    ) -> tuple[str, int]:
+        """
+        Stream a response body to `target_path` without clobbering it early.
+
+        The body is written to `<target_path>.part`, which replaces
+        `target_path` only after the last byte has been received.
+
+        Args:
+            response (requests.Response): A streamed (`stream=True`) response.
+            target_path (str): Final path of the downloaded file.
+
+        Returns:
+            tuple[str, int]: SHA-256 hex digest and size of the written file.
+
+        Raises:
+            requests.ConnectionError: If reading the body times out.
+            requests.exceptions.ChunkedEncodingError: If the connection
+                breaks mid-stream. urllib3 raises these errors on raw reads;
+                they are wrapped like `Response.iter_content` does.
+        """
+        part_path = target_path + ".part"
+        response.raw.decode_content = True
+        try:
+            with open(part_path, "wb") as f:
+                sha256, size = _copy_and_hash(response.raw, f)
+            os.replace(part_path, target_path)
+        except urllib3.exceptions.ReadTimeoutError as exc:
+            raise requests.ConnectionError(exc) from exc
+        except urllib3.exceptions.HTTPError as exc:
+            raise requests.exceptions.ChunkedEncodingError(exc) from exc
+        finally:
+            # Only left behind when the transfer failed.
+            if os.path.exists(part_path):
+                os.remove(part_path)
+        return sha256, size
+
+    @staticmethod
+    def _is_cached_copy_valid(target_path: str, entry: dict) -> bool:
+        """
+        Check whether a previously downloaded file is complete and usable.
+
+        Args:
+            target_path (str): Local path of the downloaded CSV or shapefile
+                zip.
+            entry (dict): Manifest entry recorded for the source URL.
+
+        Returns:
+            bool: True if the local file exists and matches the recorded
+            size, which catches interrupted writes.
+        """
+        if not os.path.exists(target_path):
+            return False
+        return os.path.getsize(target_path) == entry.get("size")
+
+    def _read_manifest(self) -> Dict[str, dict]:
+        """
+        Load the download manifest from `self.manifest_path`.
+
+        Returns:
+            dict[str, dict]: Mapping from source URL to its recorded
+            `etag`, `last_modified`, `sha256`, and `size`. Empty if the
+            manifest is missing or unreadable.
+        """
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_manifest(self) -> None:
+        """
+        Persist `self._manifest` atomically to `self.manifest_path`.
+
+        Returns:
+            None
+        """
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _merged_cache_path(self) -> str:
+        """
+        Build the GeoParquet path of the merged layer for the current inputs.
+
+        The file name embeds a short SHA-1 of the configured sources (URL,
+        filename, type), their download manifest entries, the modification
+        times of the local inputs (CSVs and shapefile zip),
+        `SHAPEFILE_COLUMNS`, and `SIMPLIFY_TOLERANCE`. Editing
+        `project_sources`, the shapefile columns, or the tolerance changes
+        the key directly, and entries of sources that are no longer
+        configured do not take part in it. Every re-download changes a
+        source's ETag/checksum in the manifest, and a file replaced or
+        touched outside the downloader changes its mtime, so either way a
+        stale merged layer is never reused.
+
+        Returns:
+            str: Path of the form `<download_dir>/merged_<key>.parquet`.
+        """
+        input_mtimes = {}
         for source in self.sources:
-            url_str = str(source.url)
-            
-            if source.is_shapefile:
-                shapefile_zip = os.path.join(self.download_dir, "ne_110m_admin_0_countries.zip")
-                if not os.path.exists(shapefile_zip):
-                    print(f"Downloading shapefile...")
-                    response = requests.get(url_str, stream=True, timeout=(10, 60))
-                    response.raise_for_status()
-                    with open(shapefile_zip, "wb") as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            f.write(chunk)
-                    with zipfile.ZipFile(shapefile_zip, "r") as zf:
-                        zf.extractall(self.shapefile_dir)
-            else:
-                csv_path = os.path.join(self.download_dir, source.filename)
-                if not os.path.exists(csv_path):
-                    print(f"Downloading {source.filename}...")
-                    response = requests.get(url_str, stream=True, timeout=(10, 60))
-                    response.raise_for_status()
-                    
-                    with open(csv_path, "wb") as f:
-                        f.write(response.content)
+            path = (
+                self.shapefile_zip if source.is_shapefile
+                else os.path.join(self.download_dir, source.filename)
+            )
+            if os.path.exists(path):
+                input_mtimes[path] = os.stat(path).st_mtime_ns
+
+        source_urls = [str(source.url) for source in self.sources]
+        key = hashlib.sha1(
+            json.dumps(
+                {
+                    "sources": [
+                        (str(source.url), source.filename, source.is_shapefile)
+                        for source in self.sources
+                    ],
+                    "manifest": {url: self._manifest.get(url) for url in source_urls},
+                    "inputs": input_mtimes,
+                    "shapefile_columns": self.SHAPEFILE_COLUMNS,
+                    "simplify_tolerance": self.SIMPLIFY_TOLERANCE,
+                },
+                sort_keys=True,
+            ).encode()
+        ).hexdigest()[:12]
+        return os.path.join(self.download_dir, f"merged_{key}.parquet")
+
+    def _read_merged_cache(self, path: str) -> bool:
+        """
+        Load `self.merged_data` from a cached merged layer, if usable.
+
+        Args:
+            path (str): Cache file from `_merged_cache_path`.
+
+        Returns:
+            bool: True if the cache was loaded; False if it is missing or
+            cannot be read (e.g. truncated), in which case the merge has to
+            run again.
+        """
+        if not os.path.exists(path):
+            return False
+
+        import geopandas as gpd
+
+        try:
+            self.merged_data = gpd.read_parquet(path)
+        except (OSError, ValueError):
+            return False
+        return True
+
+    def _write_merged_cache(self, path: str) -> None:
+        """
+        Persist `self.merged_data` to `path` and remove outdated copies.
+
+        The new file is written atomically (see `_write_parquet_atomic`)
+        before older `merged_*.parquet` files are deleted, so an interrupted
+        write never leaves a partial cache under a valid key.
+
+        Args:
+            path (str): Target from `_merged_cache_path`.
+
+        Returns:
+            None
+        """
+        if self.merged_data is None:
+            return
+
+        _write_parquet_atomic(self.merged_data, path)
+        for name in os.listdir(self.download_dir):
+            if (
+                name.startswith("merged_") and name.endswith(".parquet")
+                and name != os.path.basename(path)
+            ):
+                os.remove(os.path.join(self.download_dir, name))
 
     def _load_and_clean_dataframes(self) -> None:
         """
@@ -237,21 +630,35 @@ class OkavangoData:
         metric. OWID CSV exports may contain many years or varying schema
         conventions. This method normalizes all sources into a consistent
         shape:
-        - a shared key column "Code",
+        - a shared "Code" key, used as the index,
         - the latest observation per country when "Year" is available,
         - only the metric columns required for visualization.
 
         For each source:
-        - Shapefile sources are loaded into `self.geo_dataframe`.
+        - Shapefile sources are loaded into `self.geo_dataframe` from the
+          columnar GeoParquet copy while it is readable, at least as new as
+          the zip, and holds exactly `SHAPEFILE_COLUMNS`. Otherwise the .shp is read straight out of the archive
+          through GDAL's `/vsizip/` filesystem (no extraction) with the
+          vectorized pyogrio/Arrow reader rather than per-feature Fiona
+          iteration, and the GeoParquet copy is (re)written atomically. Only
+          `SHAPEFILE_COLUMNS` and the geometry are read.
         - CSV sources are read into pandas DataFrames and cleaned by:
-          1) Identifying a likely geographic identifier column.
-          2) Renaming that column to "Code" (dropping any pre-existing "Code"
-             column when necessary to avoid ambiguity).
+          1) Identifying a likely geographic identifier column from the
+             header alone, then parsing only that column, "Year", and the
+             metric columns with the multi-threaded pyarrow CSV engine.
+             Free-text OWID annotation columns are never parsed.
+          2) Renaming that column to "Code" (a pre-existing "Code" column is
+             not loaded in that case, to avoid ambiguity), then downcasting
+             float metrics to float32 and "Year" to int16 to halve the bytes
+             carried through the merge and into plotting.
           3) Dropping rows with missing country codes.
-          4) If present, sorting by "Year" descending and keeping the most
-             recent row per country.
-          5) Keeping only "Code" plus metric columns (dropping "Year",
-             "Entity", and "Country" fields when present).
+          4) If present, keeping the most recent "Year" row per country via a
+             single hash-grouped `idxmax` pass (no global sort). Ties keep
+             the last row in file order; a country whose years are all
+             missing keeps its last row.
+          5) Keeping only the metric columns, indexed by "Code" so the
+             merge step can join on it directly (dropping "Year", "Entity",
+             and "Country" fields when present).
 
         Returns:
             None
@@ -269,6 +676,12 @@ class OkavangoData:
                 contents.
 
         Note:
+            - Each cleaned DataFrame is cached next to its CSV as
+              `<filename>.parquet`. While that file is at least as new as the
+              CSV it is loaded directly, skipping CSV parsing and cleaning; a
+              fresh download makes the CSV newer and invalidates the cache.
+              The file is replaced atomically, and one that cannot be read
+              (e.g. truncated) is rebuilt from the CSV.
             - If no suitable geographic identifier column is found, that CSV
               is skipped.
             - Cleaned DataFrames are stored in `self.dataframes` keyed by
@@ -282,48 +695,100 @@ class OkavangoData:
         """
         for source in self.sources:
             if source.is_shapefile:
-                shp_path = os.path.join(self.shapefile_dir, "ne_110m_admin_0_countries.shp")
-                self.geo_dataframe = gpd.read_file(shp_path)
+                import geopandas as gpd
+
+                self.geo_dataframe = None
+                if os.path.exists(self.geoparquet_path) and (
+                    not os.path.exists(self.shapefile_zip)
+                    or os.path.getmtime(self.geoparquet_path)
+                    >= os.path.getmtime(self.shapefile_zip)
+                ):
+                    try:
+                        cached = gpd.read_parquet(self.geoparquet_path)
+                    except (OSError, ValueError):
+                        # An unreadable copy is a miss: rebuild it below.
+                        cached = None
+                    # A copy written for another SHAPEFILE_COLUMNS is a miss too.
+                    if cached is not None and set(
+                        cached.columns.drop(cached.geometry.name)
+                    ) == set(self.SHAPEFILE_COLUMNS):
+                        self.geo_dataframe = cached
+
+                if self.geo_dataframe is None:
+                    self.geo_dataframe = gpd.read_file(
+                        self.shapefile_path, engine="pyogrio", use_arrow=True,
+                        columns=self.SHAPEFILE_COLUMNS,
+                    )
+                    _write_parquet_atomic(self.geo_dataframe, self.geoparquet_path)
             else:
                 csv_path = os.path.join(self.download_dir, source.filename)
                 if not os.path.exists(csv_path):
                     continue
-                
-                df = pd.read_csv(csv_path, encoding='utf-8-sig')
 
-                geo_col = None
-                for col in df.columns:
-                    clean_col = col.lower()
-                    if "code" in clean_col or "iso" in clean_col:
-                        geo_col = col
-                        break
+                parquet_path = csv_path + ".parquet"
+                if (
+                    os.path.exists(parquet_path)
+                    and os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path)
+                ):
+                    try:
+                        self.dataframes[source.filename] = pd.read_parquet(parquet_path)
+                        continue
+                    except (OSError, ValueError):
+                        # An unreadable cache is a miss: rebuild it below.
+                        pass
                 
-                if not geo_col:
-                    for col in df.columns:
-                        clean_col = col.lower()
-                        if "entity" in clean_col or "country" in clean_col or "name" in clean_col:
-                            geo_col = col
-                            break
-
-                if not geo_col:
+                header = pd.read_csv(csv_path, nrows=0, encoding='utf-8-sig').columns
+
+                lowered = header.str.lower()
+                primary = lowered.str.contains("code|iso", regex=True)
+                secondary = lowered.str.contains("entity|country|name", regex=True)
+                if primary.any():
+                    geo_col = header[primary.argmax()]
+                elif secondary.any():
+                    geo_col = header[secondary.argmax()]
+                else:
                     continue
 
+                keep = (
+                    (header != geo_col)
+                    & ~header.isin(["Code", "Entity", "Country"])
+                    & ~lowered.str.contains("annotation", regex=False)
+                )
+                usecols = [geo_col, *header[keep]]
+                df = pd.read_csv(
+                    csv_path, engine="pyarrow", usecols=usecols, encoding='utf-8-sig'
+                )
+
                 if geo_col != "Code":
-                    if "Code" in df.columns:
-                        df.drop(columns=["Code"], inplace=True) 
                     df.rename(columns={geo_col: "Code"}, inplace=True)
+
+                for col in df.select_dtypes("float64").columns:
+                    df[col] = df[col].astype("float32")
+                if "Year" in df.columns and pd.api.types.is_integer_dtype(df["Year"]):
+                    df["Year"] = df["Year"].astype("int16")
                 
                 df = df.dropna(subset=["Code"])
 
                 if "Year" in df.columns:
-                    df = df.sort_values("Year", ascending=False).drop_duplicates(subset=["Code"])
+                    # Scan bottom-up so that, as with the former stable sort,
+                    # the last row in file order wins ties; missing years rank
+                    # lowest and are only kept for countries without any.
+                    reversed_df = df.iloc[::-1]
+                    latest_idx = (
+                        reversed_df["Year"]
+                        .fillna(float("-inf"))
+                        .groupby(reversed_df["Code"], sort=False)
+                        .idxmax()
+                    )
+                    df = df.loc[latest_idx]
 
                 keep_cols = ["Code"]
                 for col in df.columns:
                     if col not in ["Code", "Year", "Entity", "Country"]:
                         keep_cols.append(col)
                 
-                df = df[keep_cols]
+                df = df[keep_cols].set_index("Code")
+                _write_parquet_atomic(df, parquet_path, compression="zstd")
                 self.dataframes[source.filename] = df
 
     def merge_geospatial_layers(self) -> None:
@@ -336,13 +801,34 @@ class OkavangoData:
         some metrics are missing.
 
         Process:
-        - Creates a copy of `self.geo_dataframe`.
+        - Starts from `self.geo_dataframe` without an upfront copy; the join
+          and the geometry assignment below return new frames, so the
+          loaded layer is never modified.
         - Determines which country code column to use for joining:
           - Uses "ADM0_A3" if present, otherwise uses "ISO_A3".
-        - Iterates through each cleaned DataFrame in `self.dataframes` and
-          left-joins it to the GeoDataFrame on the chosen map code column vs
-          the metric "Code" column.
-        - Drops any merge-produced duplicate columns with the suffix "_drop".
+        - Takes each cleaned DataFrame in `self.dataframes`, which is already
+          indexed by "Code" (a plain "Code" column is indexed here), and
+          aligns them all with a single outer `pd.concat(axis=1)`, keeping
+          the first occurrence of any repeated metric column (and of any
+          repeated country code).
+        - Left-joins that combined table to the GeoDataFrame once with
+          `join(on=...)`, reusing the prebuilt "Code" index instead of
+          hashing the key again for one merge per dataset.
+        - Joins on a temporary key holding the map codes cast to one shared
+          `CategoricalDtype` (built from the map's codes), as is the combined
+          "Code" index, so the join compares small integer category codes
+          instead of hashing strings. Codes unknown to the map (e.g. OWID
+          aggregates such as "OWID_WRL") cannot match a left join and are
+          dropped first; the map code column itself keeps its string dtype.
+        - Metric columns whose names clash with a map attribute are dropped
+          from the combined table before the join, so the join produces no
+          suffixed duplicates that would need filtering (and another full
+          copy of the GeoDataFrame) afterwards.
+        - Coerces every metric column to numeric once (unparseable values
+          become NaN), so the dashboard can plot and rank them directly on
+          every rerun.
+        - Simplifies the country polygons once with `SIMPLIFY_TOLERANCE`, so
+          every map render afterwards draws fewer vertices.
 
         Returns:
             None
@@ -367,20 +853,108 @@ class OkavangoData:
         if self.geo_dataframe is None:
             return
 
-        merged_gdf = self.geo_dataframe.copy()
+        merged_gdf = self.geo_dataframe
         map_code_col = "ADM0_A3" if "ADM0_A3" in merged_gdf.columns else "ISO_A3"
 
+        frames = []
         for filename, df in self.dataframes.items():
             if df.empty:
                 continue
-                
-            merged_gdf = merged_gdf.merge(
-                df, left_on=map_code_col, right_on="Code", how="left",
-                suffixes=("", "_drop")
+            frame = df.set_index("Code") if "Code" in df.columns else df
+            frames.append(frame[~frame.index.duplicated(keep="first")])
+
+        if frames:
+            combined = pd.concat(frames, axis=1, join="outer")
+            combined = combined.loc[:, ~combined.columns.duplicated(keep="first")]
+            combined = combined.drop(columns=combined.columns.intersection(merged_gdf.columns))
+            combined = combined.apply(
+                pd.to_numeric, errors="coerce", downcast="float"
+            )
+
+            code_dtype = pd.CategoricalDtype(
+                categories=sorted(merged_gdf[map_code_col].dropna().unique())
+            )
+            combined = combined[combined.index.isin(code_dtype.categories)]
+            combined.index = combined.index.astype(code_dtype)
+
+            merged_gdf = (
+                merged_gdf.assign(_code_key=merged_gdf[map_code_col].astype(code_dtype))
+                .join(combined, on="_code_key")
+                .drop(columns="_code_key")
             )
-            merged_gdf = merged_gdf[[c for c in merged_gdf.columns if not c.endswith("_drop")]]
 
-        self.merged_data = merged_gdf
+        self.merged_data = merged_gdf.assign(
+            geometry=merged_gdf.geometry.simplify(
+                self.SIMPLIFY_TOLERANCE, preserve_topology=True
+            )
+        )
+
+
+def _extreme_positions(values: np.ndarray, k: int, largest: bool) -> np.ndarray:
+    """
+    Return the positions of the `k` largest (or smallest) entries of `values`.
+
+    The cut-off value is found with one O(n) `np.partition`; every entry
+    strictly beyond it is taken, and the remaining slots go to the entries
+    equal to the cut-off in position order. Ties therefore resolve like
+    `nlargest`/`nsmallest` with `keep="first"`.
+
+    Args:
+        values (np.ndarray): 1-D array without NaNs.
+        k (int): Number of positions to return, `0 < k <= len(values)`.
+        largest (bool): Select the largest values if True, else the smallest.
+
+    Returns:
+        np.ndarray: The selected positions in ascending order.
+    """
+    kth = len(values) - k if largest else k - 1
+    cutoff = np.partition(values, kth)[kth]
+    beyond = values > cutoff if largest else values < cutoff
+    tied = np.flatnonzero(values == cutoff)[: k - np.count_nonzero(beyond)]
+    return np.sort(np.concatenate([np.flatnonzero(beyond), tied]))
+
+
+def select_extremes(
+    data: pd.DataFrame, metric: str, n: int = 5
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Select the rows with the highest and lowest values of a numeric metric.
+
+    Rows with a missing value are ignored. Each extreme is found in O(n)
+    around a partitioned cut-off value instead of with a full sort; only the
+    selected `n` rows are sorted afterwards. The result matches
+    `nlargest(n, metric)` / `nsmallest(n, metric)`: tied values keep the
+    first rows in frame order.
+
+    Args:
+        data (pd.DataFrame): Table holding `metric`, e.g. `merged_data`.
+        metric (str): Name of a numeric column of `data`.
+        n (int): Number of rows per extreme. Defaults to 5.
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame]: The `n` rows with the highest
+        values in descending order, and the `n` rows with the lowest values
+        in ascending order. With `n` or fewer valued rows, both hold all of
+        them; with `n <= 0`, both are empty.
+
+    Example:
+        >>> top, bottom = select_extremes(handler.merged_data, "Value")
+        >>> top["Value"].is_monotonic_decreasing
+        True
+    """
+    chart_data = data.dropna(subset=[metric])
+
+    k = min(n, len(chart_data))
+    if k <= 0:
+        return chart_data.iloc[:0], chart_data.iloc[:0]
+
+    values = chart_data[metric].to_numpy()
+    top = chart_data.iloc[_extreme_positions(values, k, largest=True)]
+    bottom = chart_data.iloc[_extreme_positions(values, k, largest=False)]
+    return (
+        top.sort_values(metric, ascending=False, kind="stable"),
+        bottom.sort_values(metric, kind="stable"),
+    )
 
 
 # --- PROJECT SOURCES CONFIGURATION ---
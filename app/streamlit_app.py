@@ -10,7 +10,7 @@ The dashboard provides:
 
 Dependencies
 ------------
-streamlit, matplotlib, pandas, geopandas
+streamlit, pydeck, matplotlib, numpy, pandas, geopandas
 app.data_handler (for OkavangoData and project_sources)
 
 Usage
@@ -28,13 +28,19 @@ import importlib
 from pathlib import Path
 from typing import Any, Optional
 
+import geopandas as gpd
+import numpy as np
 import pandas as pd
+import pydeck as pdk
 import streamlit as st
 import matplotlib.pyplot as plt
+from matplotlib import colormaps
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import Normalize
 from matplotlib.ticker import FuncFormatter, ScalarFormatter
 from matplotlib.patches import Patch
 
-from data_handler import OkavangoData, project_sources
+from data_handler import OkavangoData, project_sources, select_extremes
 
 
 # ==========================================
@@ -252,6 +258,13 @@ METRIC_UNITS = {
 }
 
 
+CHOROPLETH_CMAP = colormaps["YlGnBu"]
+CHOROPLETH_LUT = (
+    CHOROPLETH_CMAP(np.linspace(0.0, 1.0, 256)) * 255
+).astype(np.uint8)
+NO_DATA_COLOR = [211, 211, 211, 255]  # matplotlib "lightgrey"
+
+
 def normalize_metric_name(raw_name: str) -> str:
     """Normalize metric names for robust label/unit lookups.
 
@@ -310,6 +323,29 @@ def metric_label_with_unit(raw_name: str) -> str:
     return f"{pretty_name} ({unit})"
 
 
+def metric_fill_colors(values: pd.Series, norm: Normalize) -> np.ndarray:
+    """Map metric values to RGBA fill colors for the choropleth layer.
+
+    Args:
+        values: Numeric metric values, one per country (NaN for no data).
+        norm: Normalization mapping the metric range onto [0, 1].
+
+    Colors are gathered from the precomputed 256-entry `CHOROPLETH_LUT` in a
+    single NumPy indexing step instead of evaluating the colormap per value.
+
+    Returns:
+        A (n, 4) uint8 array of RGBA colors from `CHOROPLETH_CMAP`, with
+        countries lacking data painted `NO_DATA_COLOR`.
+    """
+    scaled = np.nan_to_num(
+        np.asarray(norm(values.to_numpy(dtype="float64"))), nan=0.0
+    )
+    lut_index = np.rint(np.clip(scaled, 0.0, 1.0) * 255).astype(np.uint8)
+    colors = CHOROPLETH_LUT[lut_index]
+    colors[values.isna().to_numpy()] = NO_DATA_COLOR
+    return colors
+
+
 def _first_non_empty(
     data: dict[str, Any],
     keys: list[str],
@@ -332,29 +368,46 @@ def _first_non_empty(
     return default
 
 
-def render_page_1() -> None:
-    """Render the original map-based metrics dashboard.
+@st.cache_data(hash_funcs={gpd.GeoDataFrame: id})
+def metric_extremes(
+    data: gpd.GeoDataFrame,
+    metric: str,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Select the countries with the highest and lowest values of a metric.
 
-    Displays:
-        - Interactive map with selected environmental metric per country.
-        - Top 5 and Bottom 5 country comparisons for the selected metric.
-        - Data summary showing countries with available data.
+    Metric columns are already numeric (the data handler coerces them once
+    after the merge), so this only does the top/bottom selection via
+    `select_extremes`. Cached per metric so switching back to a previously
+    viewed indicator skips it. The GeoDataFrame is hashed by identity: it is
+    the single instance held by `get_data_handler`, so a new handler
+    naturally gets new cache entries.
+
+    Args:
+        data: Merged world GeoDataFrame.
+        metric: Name of the numeric metric column.
+
+    Returns:
+        A tuple of (the 5 rows with the highest values, the 5 rows with the
+        lowest values).
     """
-    st.subheader("Map Visualization")
-    st.sidebar.header("Dashboard Controls")
-    st.sidebar.caption(
-        "Choose the environmental indicator to visualize on the "
-        "global map."
-    )
+    return select_extremes(data, metric, n=5)
 
-    # Extract available metrics (CSV only, excludes shapefile)
-    owid_metrics = []
-    for _, df in handler.dataframes.items():
-        for col in df.columns:
-            if col != "Code":
-                owid_metrics.append(col)
 
-    # Filter to metrics that merged into geodataframe
+@st.cache_resource
+def get_valid_metrics(_handler: OkavangoData) -> list[str]:
+    """List the OWID metric columns that made it into the merged map data.
+
+    Cached alongside the data handler, so the metric discovery runs once per
+    app process rather than on every rerun. The leading underscore keeps
+    Streamlit from hashing the handler.
+
+    Args:
+        _handler: The prepared data handler returned by `get_data_handler`.
+
+    Returns:
+        Sorted, de-duplicated metric column names (CSV only, excluding
+        shapefile attributes, geometry, and annotation columns).
+    """
     # Exclude geometry, shapefile-only columns, and annotation columns
     excluded_columns = {
         "geometry",
@@ -371,13 +424,34 @@ def render_page_1() -> None:
         "SOVEREIGNT",
         "SOV_A3",
     }
+    owid_metrics = set().union(
+        *(df.columns for df in _handler.dataframes.values())
+    ) - {"Code"}
+    valid_metrics = (
+        owid_metrics & set(_handler.merged_data.columns)
+    ) - excluded_columns
+
+    return sorted(
+        col for col in valid_metrics if "annotation" not in col.lower()
+    )
 
-    valid_metrics = [
-        col for col in owid_metrics
-        if col in gdf.columns
-        and col not in excluded_columns
-        and "annotation" not in col.lower()
-    ]
+
+def render_page_1() -> None:
+    """Render the original map-based metrics dashboard.
+
+    Displays:
+        - Interactive map with selected environmental metric per country.
+        - Top 5 and Bottom 5 country comparisons for the selected metric.
+        - Data summary showing countries with available data.
+    """
+    st.subheader("Map Visualization")
+    st.sidebar.header("Dashboard Controls")
+    st.sidebar.caption(
+        "Choose the environmental indicator to visualize on the "
+        "global map."
+    )
+
+    valid_metrics = get_valid_metrics(handler)
 
     if not valid_metrics:
         st.error("Merge failed! The OWID metrics didn't attach to the map.")
@@ -389,10 +463,8 @@ def render_page_1() -> None:
         format_func=format_metric,
     )
 
-    # Ensure metric is numeric for visualization
-    gdf[selected_metric] = pd.to_numeric(
-        gdf[selected_metric], errors="coerce"
-    )
+    metric_values = gdf[selected_metric]
+    top_5, bottom_5 = metric_extremes(gdf, selected_metric)
     display_name = metric_label_with_unit(selected_metric)
     selected_unit = METRIC_UNITS.get(
         normalize_metric_name(selected_metric), ""
@@ -405,28 +477,66 @@ def render_page_1() -> None:
     # Display metric context
     st.info(f"📊 **Data Summary:** {countries_with_data} countries with data")
 
+    if countries_with_data == 0:
+        # E.g. a dataset holding only OWID aggregates ("OWID_WRL", ...): there
+        # is no value range to color the map or draw the extremes with.
+        st.info(
+            f"No country-level values are available for {display_name}; "
+            "choose another indicator."
+        )
+        return
+
     # ==========================================
     # PLOT 1: WORLD MAP VISUALIZATION
     # ==========================================
 
-    fig, ax = plt.subplots(1, 1, figsize=(15, 8))
-    gdf.plot(
-        column=selected_metric,
-        ax=ax,
-        legend=True,
-        cmap="YlGnBu",
-        missing_kwds={"color": "lightgrey", "label": "No Data"},
-        legend_kwds={
-            "label": display_name,
-            "orientation": "horizontal",
-            "shrink": 0.8,
-            "aspect": 30,
-            "pad": 0.05,
-        },
+    st.markdown(f"**Global Distribution: {display_name}**")
+
+    norm = Normalize(
+        vmin=float(np.nanmin(metric_values)),
+        vmax=float(np.nanmax(metric_values)),
+    )
+    country_col = "NAME" if "NAME" in gdf.columns else "ADMIN"
+    map_data = gdf[[country_col, "geometry"]].rename(
+        columns={country_col: "country"}
+    )
+    map_data["value_label"] = [
+        f"{value:,.2f} {selected_unit}".strip() if pd.notna(value)
+        else "No data"
+        for value in metric_values
+    ]
+    map_data["fill_color"] = metric_fill_colors(metric_values, norm).tolist()
+
+    choropleth_layer = pdk.Layer(
+        "GeoJsonLayer",
+        data=map_data.__geo_interface__,
+        get_fill_color="properties.fill_color",
+        get_line_color=[255, 255, 255],
+        line_width_min_pixels=0.5,
+        pickable=True,
+    )
+    st.pydeck_chart(
+        pdk.Deck(
+            layers=[choropleth_layer],
+            initial_view_state=pdk.ViewState(
+                latitude=20, longitude=0, zoom=0.7
+            ),
+            map_style=None,
+            tooltip={"html": "<b>{country}</b><br/>{value_label}"},
+        ),
+        use_container_width=True,
+    )
+
+    # Colorbar legend, rendered separately from the (WebGL) map.
+    fig, colorbar_ax = plt.subplots(figsize=(12, 0.9))
+    fig.colorbar(
+        ScalarMappable(norm=norm, cmap=CHOROPLETH_CMAP),
+        cax=colorbar_ax,
+        orientation="horizontal",
+        label=display_name,
     )
 
     # Improve colorbar readability for large-value metrics.
-    colorbar_ax = fig.axes[-1]
     normalized = normalize_metric_name(selected_metric)
     large_value_metrics = {
         "deforestation",
@@ -452,13 +562,6 @@ def render_page_1() -> None:
             f"Unit: {selected_unit}", fontsize=10, pad=8
         )
 
-    ax.set_title(
-        f"Global Distribution: {display_name}",
-        fontsize=16,
-        fontweight="bold",
-        pad=20,
-    )
-    ax.set_axis_off()
     st.pyplot(fig)
     st.caption(
         "Grey countries indicate no available source value for the "
@@ -473,10 +576,6 @@ def render_page_1() -> None:
 
     st.subheader(f"Extremes: Top 5 and Bottom 5 Countries for {display_name}")
 
-    chart_data = gdf.dropna(subset=[selected_metric])
-    top_5 = chart_data.nlargest(5, selected_metric)
-    bottom_5 = chart_data.nsmallest(5, selected_metric)
-
     # Concatenate bottom 5 first (left), then top 5 (right)
     extremes_df = pd.concat([bottom_5, top_5])
 
@@ -564,6 +663,20 @@ def render_risk_badge(is_danger: bool) -> None:
     )
 
 
+@st.cache_resource
+def get_basemap_geojson(_data: gpd.GeoDataFrame) -> dict:
+    """Serialize the country outlines once for the location preview basemap.
+
+    Args:
+        _data: The merged map data; only its geometry column is used. The
+            leading underscore keeps Streamlit from hashing the frame.
+
+    Returns:
+        A GeoJSON FeatureCollection of the country polygons.
+    """
+    return _data[["geometry"]].__geo_interface__
+
+
 def render_location_preview_map(lat: float, lon: float) -> None:
     """Render a lightweight world map with a marker at the selected location.
 
@@ -571,42 +684,48 @@ def render_location_preview_map(lat: float, lon: float) -> None:
         lat: Latitude coordinate of the location to mark.
         lon: Longitude coordinate of the location to mark.
     """
-    fig, ax = plt.subplots(1, 1, figsize=(10, 4.8))
-
     # Draw a neutral basemap (no data coloring) to orient selected coordinates.
-    gdf.plot(
-        ax=ax,
-        color="#eef2f7",
-        edgecolor="#94a3b8",
-        linewidth=0.35,
+    basemap_layer = pdk.Layer(
+        "GeoJsonLayer",
+        data=get_basemap_geojson(gdf),
+        get_fill_color=[238, 242, 247],  # "#eef2f7"
+        get_line_color=[148, 163, 184],  # "#94a3b8"
+        line_width_min_pixels=0.35,
     )
-
-    ax.scatter(
-        [lon], [lat],
-        s=95,
-        c="#dc2626",
-        edgecolors="white",
-        linewidths=1.2,
-        zorder=5,
+    marker = [{"lon": lon, "lat": lat, "label": f"({lat:.2f}, {lon:.2f})"}]
+    marker_layer = pdk.Layer(
+        "ScatterplotLayer",
+        data=marker,
+        get_position=["lon", "lat"],
+        get_fill_color=[220, 38, 38],  # "#dc2626"
+        get_line_color=[255, 255, 255],
+        stroked=True,
+        radius_min_pixels=6,
+        line_width_min_pixels=1.2,
     )
-
-    ax.annotate(
-        f"({lat:.2f}, {lon:.2f})",
-        xy=(lon, lat),
-        xytext=(8, 8),
-        textcoords="offset points",
-        fontsize=9,
-        color="#111827",
-        bbox={"boxstyle": "round,pad=0.2", "fc": "white", "ec": "#cbd5e1", "alpha": 0.95},
+    label_layer = pdk.Layer(
+        "TextLayer",
+        data=marker,
+        get_position=["lon", "lat"],
+        get_text="label",
+        get_size=13,
+        get_color=[17, 24, 39],  # "#111827"
+        get_pixel_offset=[10, -10],
+        get_text_anchor="'start'",
+        background=True,
     )
 
-    ax.set_title(
-        "Selected Location Preview", fontsize=12, fontweight="bold", pad=8
+    st.markdown("**Selected Location Preview**")
+    st.pydeck_chart(
+        pdk.Deck(
+            layers=[basemap_layer, marker_layer, label_layer],
+            initial_view_state=pdk.ViewState(
+                latitude=20, longitude=0, zoom=0.7
+            ),
+            map_style=None,
+        ),
+        use_container_width=True,
     )
-    ax.set_xlim(-180, 180)
-    ax.set_ylim(-85, 85)
-    ax.set_axis_off()
-    st.pyplot(fig)
 
 
 def render_page_2() -> None:
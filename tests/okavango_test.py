@@ -2,10 +2,12 @@
 Unit Tests for Project Okavango Data Pipeline
 
 This module contains pytest-based unit tests for the `OkavangoData` pipeline, focusing
-on two core responsibilities:
+on three core responsibilities:
 
 1) Downloading project data (`download_project_data`) without making real network calls.
 2) Merging cleaned metric tables into a geospatial layer (`merge_geospatial_layers`).
+3) Reusing and invalidating the on-disk caches (Parquet sidecars of the cleaned CSVs
+   and the merged `merged_<key>.parquet` layer) across runs.
 
 Reasoning
 ---------
@@ -19,6 +21,7 @@ Dependencies
 ------------
 pytest
 unittest.mock (patch, MagicMock)
+requests, urllib3
 pandas, geopandas
 shapely
 
@@ -29,10 +32,26 @@ Run the full test suite from the project root:
 >>> pytest -q
 """
 
+import hashlib
+import io
+import os
+import zipfile
+
 import pytest
+import requests
+import urllib3
 from unittest.mock import patch, MagicMock
 
-from app.data_handler import OkavangoData, DataSource
+from app.data_handler import OkavangoData, DataSource, select_extremes
+
+
+def _fake_response(content=b"", status_code=200, headers=None):
+    """Build a mocked streamed `requests.Response` serving `content`."""
+    response = MagicMock()
+    response.raw = io.BytesIO(content)
+    response.status_code = status_code
+    response.headers = headers if headers is not None else {"ETag": '"v1"'}
+    return response
 
 
 def test_download(tmp_path):
@@ -41,11 +60,11 @@ def test_download(tmp_path):
 
     Reasoning
     ---------
-    The production code downloads data using `requests.get`. In tests, we patch the
-    network call so the test does not depend on internet access and remains repeatable.
+    The production code downloads data through a shared `requests.Session`. In tests,
+    we patch `Session.get` so the test does not depend on internet access and remains repeatable.
 
     This test checks that:
-    - `requests.get` is called exactly once,
+    - `Session.get` is called exactly once,
     - the expected file is created in the provided temporary directory,
     - the file content matches the mocked HTTP response content.
 
@@ -78,9 +97,12 @@ def test_download(tmp_path):
 
     fake_response = MagicMock()
     fake_response.content = b"Code,Year,Value\nUSA,2023,10\n"
+    fake_response.raw = io.BytesIO(fake_response.content)
+    fake_response.status_code = 200
+    fake_response.headers = {"ETag": '"v1"'}
     fake_response.raise_for_status = MagicMock()
 
-    with patch("app.data_handler.requests.get", return_value=fake_response) as mock_get:
+    with patch("app.data_handler.requests.Session.get", return_value=fake_response) as mock_get:
 
         OkavangoData(
             sources=[source],
@@ -96,9 +118,271 @@ def test_download(tmp_path):
         assert file_path.read_bytes() == fake_response.content
 
 
+def test_download_not_modified(tmp_path):
+    """
+    Verify that an unchanged source is revalidated instead of re-downloaded.
+
+    Reasoning
+    ---------
+    After a first download, the handler records the server's ETag in the download
+    manifest. A later run must send it back as `If-None-Match`; when the server
+    answers `304 Not Modified`, the local file has to be kept untouched.
+
+    This test checks that:
+    - the second request carries the stored ETag,
+    - a 304 response leaves the previously downloaded file unchanged.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Built-in pytest fixture providing a temporary directory unique to this test.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    AssertionError
+        If the conditional header is missing or the local file is overwritten.
+
+    Examples
+    --------
+    Run this test only:
+
+    >>> pytest -q -k test_download_not_modified
+    """
+
+    source = DataSource(
+        url="https://example.com/test.csv",
+        filename="test.csv"
+    )
+    content = b"Code,Year,Value\nUSA,2023,10\n"
+
+    first_response = MagicMock()
+    first_response.raw = io.BytesIO(content)
+    first_response.status_code = 200
+    first_response.headers = {"ETag": '"v1"'}
+
+    not_modified = MagicMock()
+    not_modified.status_code = 304
+    not_modified.headers = {"ETag": '"v1"'}
+
+    with patch(
+        "app.data_handler.requests.Session.get",
+        side_effect=[first_response, not_modified]
+    ) as mock_get:
+
+        OkavangoData(sources=[source], download_dir=str(tmp_path))
+        OkavangoData(sources=[source], download_dir=str(tmp_path))
+
+        assert mock_get.call_count == 2
+
+        second_headers = mock_get.call_args_list[1].kwargs["headers"]
+        assert second_headers["If-None-Match"] == '"v1"'
+
+        assert (tmp_path / "test.csv").read_bytes() == content
+
+
+def test_download_size_mismatch(tmp_path):
+    """
+    Verify that an incomplete local copy is re-downloaded unconditionally.
+
+    Reasoning
+    ---------
+    A local file whose size differs from the manifest record was cut short (or
+    edited), so it must neither be revalidated with the stored ETag nor be used
+    as a fallback.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Built-in pytest fixture providing a temporary directory unique to this test.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    AssertionError
+        If conditional headers are sent or the file is not restored.
+
+    Examples
+    --------
+    >>> pytest -q -k test_download_size_mismatch
+    """
+
+    source = DataSource(url="https://example.com/test.csv", filename="test.csv")
+    content = b"Code,Year,Value\nUSA,2023,10\n"
+
+    with patch(
+        "app.data_handler.requests.Session.get",
+        side_effect=[_fake_response(content), _fake_response(content)]
+    ) as mock_get:
+
+        OkavangoData(sources=[source], download_dir=str(tmp_path))
+        (tmp_path / "test.csv").write_bytes(content[:7])
+        OkavangoData(sources=[source], download_dir=str(tmp_path))
+
+        assert mock_get.call_args_list[1].kwargs["headers"] == {}
+        assert (tmp_path / "test.csv").read_bytes() == content
+
+
+def test_download_without_validators(tmp_path):
+    """
+    Verify that a complete local copy without ETag/Last-Modified is not refetched.
+
+    Reasoning
+    ---------
+    Without validators a conditional GET is impossible, so the handler keeps
+    the complete local copy (as the original skip-existing logic did) instead
+    of downloading the source in full on every start.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Built-in pytest fixture providing a temporary directory unique to this test.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    AssertionError
+        If a second request is made.
+
+    Examples
+    --------
+    >>> pytest -q -k test_download_without_validators
+    """
+
+    source = DataSource(url="https://example.com/test.csv", filename="test.csv")
+    content = b"Code,Year,Value\nUSA,2023,10\n"
+
+    with patch(
+        "app.data_handler.requests.Session.get",
+        return_value=_fake_response(content, headers={})
+    ) as mock_get:
+
+        OkavangoData(sources=[source], download_dir=str(tmp_path))
+        OkavangoData(sources=[source], download_dir=str(tmp_path))
+
+        assert mock_get.call_count == 1
+        assert (tmp_path / "test.csv").read_bytes() == content
+
+
+@pytest.mark.parametrize(
+    "second_response",
+    [
+        requests.ConnectionError("offline"),
+        MagicMock(
+            status_code=200,
+            headers={"ETag": '"v2"'},
+            raw=MagicMock(read=MagicMock(side_effect=[
+                b"Code,Ye",
+                urllib3.exceptions.ProtocolError("Connection broken"),
+            ])),
+        ),
+    ],
+    ids=["request-fails", "stream-breaks"],
+)
+def test_download_falls_back_to_local_copy(tmp_path, second_response):
+    """
+    Verify that a failed refresh keeps using the previous complete download.
+
+    Reasoning
+    ---------
+    Whether the request itself fails (server offline) or the connection drops
+    while a changed body is streaming, the last good local copy must stay on
+    disk untouched and the pipeline must start from it.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Built-in pytest fixture providing a temporary directory unique to this test.
+    second_response : Exception or MagicMock
+        Outcome of the second `Session.get` call.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    AssertionError
+        If the local copy is overwritten, a `.part` file is left behind, or the
+        failure propagates.
+
+    Examples
+    --------
+    >>> pytest -q -k test_download_falls_back_to_local_copy
+    """
+
+    source = DataSource(url="https://example.com/test.csv", filename="test.csv")
+    content = b"Code,Year,Value\nUSA,2023,10\n"
+
+    with patch(
+        "app.data_handler.requests.Session.get",
+        side_effect=[_fake_response(content), second_response]
+    ):
+
+        OkavangoData(sources=[source], download_dir=str(tmp_path))
+        handler = OkavangoData(sources=[source], download_dir=str(tmp_path))
+
+        assert (tmp_path / "test.csv").read_bytes() == content
+        assert not (tmp_path / "test.csv.part").exists()
+        assert "Value" in handler.dataframes["test.csv"].columns
+
+
+def test_download_interrupted_without_local_copy(tmp_path):
+    """
+    Verify that a transfer broken mid-stream surfaces as a `requests` error.
+
+    Reasoning
+    ---------
+    With no previous copy to fall back on, the failure has to propagate, as
+    the documented `requests.RequestException` rather than a raw urllib3 error,
+    and must not leave a truncated file behind.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Built-in pytest fixture providing a temporary directory unique to this test.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    AssertionError
+        If no `requests.RequestException` is raised or partial files remain.
+
+    Examples
+    --------
+    >>> pytest -q -k test_download_interrupted_without_local_copy
+    """
+
+    source = DataSource(url="https://example.com/test.csv", filename="test.csv")
+    broken = _fake_response()
+    broken.raw = MagicMock(read=MagicMock(side_effect=[
+        b"Code,Ye",
+        urllib3.exceptions.ProtocolError("Connection broken"),
+    ]))
+
+    with patch("app.data_handler.requests.Session.get", return_value=broken):
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            OkavangoData(sources=[source], download_dir=str(tmp_path))
+
+    assert not (tmp_path / "test.csv").exists()
+    assert not (tmp_path / "test.csv.part").exists()
+
+
 import geopandas as gpd
 import pandas as pd
-from shapely.geometry import Point
+from shapely.geometry import Point, box
 
 
 def test_merge(tmp_path):
@@ -112,13 +396,16 @@ def test_merge(tmp_path):
     confirm the merge:
     - joins on the expected ISO code column (`ADM0_A3`),
     - preserves geometry,
-    - does not duplicate or drop rows unintentionally.
+    - does not duplicate or drop rows unintentionally,
+    - drops codes unknown to the map (OWID aggregates such as `OWID_WRL`),
+    - leaves the map's code column with its original (string) dtype.
 
     Parameters
     ----------
     tmp_path : pathlib.Path
         Built-in pytest fixture providing a temporary directory unique to this test.
-        (Used here to construct the handler consistently with other tests.)
+        (Used here to construct the handler consistently with other tests; with
+        `auto_run=False` nothing is written to it.)
 
     Returns
     -------
@@ -128,8 +415,8 @@ def test_merge(tmp_path):
     ------
     AssertionError
         If the merged output is not a GeoDataFrame, the geometry column is missing or
-        contains nulls, the row count changes unexpectedly, or metric values do not
-        match the expected country codes.
+        contains nulls, the row count changes unexpectedly, metric values do not
+        match the expected country codes, or the code column changes dtype.
 
     Examples
     --------
@@ -148,13 +435,14 @@ def test_merge(tmp_path):
     )
 
     df = pd.DataFrame({
-        "Code": ["USA", "FRA"],
-        "TestMetric": [100, 200]
+        "Code": ["USA", "FRA", "OWID_WRL"],
+        "TestMetric": [100, 200, 300]
     })
 
     handler = OkavangoData(
         sources=[],
-        download_dir=str(tmp_path)
+        download_dir=str(tmp_path),
+        auto_run=False
     )
 
     handler.geo_dataframe = geo_df
@@ -173,4 +461,778 @@ def test_merge(tmp_path):
     assert "TestMetric" in merged.columns
 
     assert merged.loc[merged["ADM0_A3"] == "USA", "TestMetric"].item() == 100
-    assert merged.loc[merged["ADM0_A3"] == "FRA", "TestMetric"].item() == 200
\ No newline at end of file
+    assert merged.loc[merged["ADM0_A3"] == "FRA", "TestMetric"].item() == 200
+
+    assert "OWID_WRL" not in set(merged["ADM0_A3"])
+    assert 300 not in set(merged["TestMetric"])
+
+    assert merged["ADM0_A3"].dtype == geo_df["ADM0_A3"].dtype
+    assert not isinstance(merged["ADM0_A3"].dtype, pd.CategoricalDtype)
+
+
+def test_latest_year_per_country(tmp_path):
+    """
+    Verify that cleaning keeps exactly one (the latest) row per country.
+
+    Reasoning
+    ---------
+    The dashboard shows a single value per country. When several rows share the
+    latest year, the last one in file order is kept; missing years rank below any
+    real year, and a country with no year at all still keeps its last row
+    instead of failing the whole load.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Built-in pytest fixture providing a temporary directory unique to this test.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    AssertionError
+        If a country is lost or the wrong row is kept.
+
+    Examples
+    --------
+    >>> pytest -q -k test_latest_year_per_country
+    """
+
+    source = DataSource(url="https://example.com/test.csv", filename="test.csv")
+    content = (
+        b"Entity,Code,Year,Value\n"
+        b"A,AAA,2000,1\n"
+        b"A,AAA,2001,2\n"
+        b"A,AAA,2001,3\n"
+        b"B,BBB,,4\n"
+        b"B,BBB,,5\n"
+        b"C,CCC,,6\n"
+        b"C,CCC,1999,7\n"
+    )
+
+    with patch(
+        "app.data_handler.requests.Session.get",
+        return_value=_fake_response(content)
+    ):
+        handler = OkavangoData(sources=[source], download_dir=str(tmp_path))
+
+    values = handler.dataframes["test.csv"]["Value"]
+
+    assert values.index.is_unique
+    assert values.to_dict() == {"AAA": 3, "BBB": 5, "CCC": 7}
+
+
+CSV_URL = "https://example.com/test.csv"
+SHAPEFILE_URL = "https://example.com/countries.zip"
+
+
+def _shapefile_zip(tmp_path):
+    """Build a two-country Natural Earth-like shapefile zip and return its bytes."""
+    shp_dir = tmp_path / "shp"
+    shp_dir.mkdir()
+    gpd.GeoDataFrame(
+        {
+            "ADM0_A3": ["USA", "FRA"],
+            "ISO_A3": ["USA", "FRA"],
+            "NAME": ["United States", "France"],
+            "ADMIN": ["United States of America", "France"],
+        },
+        geometry=[box(-100, 30, -90, 40), box(0, 45, 5, 50)],
+        crs="EPSG:4326",
+    ).to_file(shp_dir / "ne_110m_admin_0_countries.shp", engine="pyogrio")
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        for path in shp_dir.iterdir():
+            zf.write(path, path.name)
+    return buffer.getvalue()
+
+
+def _fake_server(files):
+    """
+    Build a `Session.get` side effect serving `files` (URL -> bytes).
+
+    Each body gets an ETag derived from its content, and a request carrying the
+    current ETag in `If-None-Match` is answered with `304 Not Modified`, like a
+    real server. Tests can change `files` between runs to publish new data.
+    """
+    def get(url, headers=None, **kwargs):
+        content = files[url]
+        etag = '"%s"' % hashlib.sha1(content).hexdigest()
+        if headers and headers.get("If-None-Match") == etag:
+            return _fake_response(status_code=304, headers={"ETag": etag})
+        return _fake_response(content, headers={"ETag": etag})
+    return get
+
+
+def _merged_cache_files(download_dir):
+    """List the merged-layer GeoParquet files in `download_dir`."""
+    return sorted(
+        name for name in os.listdir(download_dir)
+        if name.startswith("merged_") and name.endswith(".parquet")
+    )
+
+
+def test_warm_start_reuses_caches(tmp_path):
+    """
+    Verify that an unchanged second run reuses the Parquet sidecar and merged cache.
+
+    Reasoning
+    ---------
+    On a warm start every source answers `304 Not Modified`, so neither the CSV
+    nor the merge has to be recomputed: the cleaned table comes from the
+    `<csv>.parquet` sidecar and the merged layer from `merged_<key>.parquet`.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Built-in pytest fixture providing a temporary directory unique to this test.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    AssertionError
+        If the CSV is parsed again, the merge runs again, or the cached result
+        differs from the freshly built one.
+
+    Examples
+    --------
+    >>> pytest -q -k test_warm_start_reuses_caches
+    """
+
+    download_dir = str(tmp_path / "downloads")
+    sources = [
+        DataSource(url=CSV_URL, filename="test.csv"),
+        DataSource(url=SHAPEFILE_URL, is_shapefile=True),
+    ]
+    files = {
+        CSV_URL: b"Entity,Code,Year,Value\nUSA,USA,2023,10\nFRA,FRA,2023,20\n",
+        SHAPEFILE_URL: _shapefile_zip(tmp_path),
+    }
+
+    with patch(
+        "app.data_handler.requests.Session.get", side_effect=_fake_server(files)
+    ):
+        cold = OkavangoData(sources=sources, download_dir=download_dir)
+
+        assert os.path.exists(os.path.join(download_dir, "test.csv.parquet"))
+        assert len(_merged_cache_files(download_dir)) == 1
+
+        with patch.object(OkavangoData, "merge_geospatial_layers") as merge, \
+                patch("app.data_handler.pd.read_csv") as read_csv:
+            warm = OkavangoData(sources=sources, download_dir=download_dir)
+
+        merge.assert_not_called()
+        read_csv.assert_not_called()
+
+    pd.testing.assert_frame_equal(warm.dataframes["test.csv"], cold.dataframes["test.csv"])
+    pd.testing.assert_frame_equal(
+        pd.DataFrame(warm.merged_data.drop(columns="geometry")),
+        pd.DataFrame(cold.merged_data.drop(columns="geometry")),
+    )
+    assert warm.merged_data.geometry.geom_equals(cold.merged_data.geometry).all()
+
+
+def test_unreadable_merged_cache_is_rebuilt(tmp_path):
+    """
+    Verify that a truncated merged-layer cache falls back to a fresh merge.
+
+    Reasoning
+    ---------
+    A partial `merged_<key>.parquet` keeps a valid key, so without a fallback every
+    later start would fail on it. The handler must merge again and replace it.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Built-in pytest fixture providing a temporary directory unique to this test.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    AssertionError
+        If startup fails, the merge is skipped, or the cache is not repaired.
+
+    Examples
+    --------
+    >>> pytest -q -k test_unreadable_merged_cache_is_rebuilt
+    """
+
+    download_dir = str(tmp_path / "downloads")
+    sources = [
+        DataSource(url=CSV_URL, filename="test.csv"),
+        DataSource(url=SHAPEFILE_URL, is_shapefile=True),
+    ]
+    files = {
+        CSV_URL: b"Entity,Code,Year,Value\nUSA,USA,2023,10\nFRA,FRA,2023,20\n",
+        SHAPEFILE_URL: _shapefile_zip(tmp_path),
+    }
+
+    with patch(
+        "app.data_handler.requests.Session.get", side_effect=_fake_server(files)
+    ):
+        OkavangoData(sources=sources, download_dir=download_dir)
+        [cache_name] = _merged_cache_files(download_dir)
+        cache_path = os.path.join(download_dir, cache_name)
+        with open(cache_path, "r+b") as f:
+            f.truncate(16)
+
+        with patch.object(
+            OkavangoData, "merge_geospatial_layers",
+            autospec=True, side_effect=OkavangoData.merge_geospatial_layers,
+        ) as merge:
+            handler = OkavangoData(sources=sources, download_dir=download_dir)
+
+    merge.assert_called_once()
+    assert _merged_cache_files(download_dir) == [cache_name]
+    assert gpd.read_parquet(cache_path).shape == handler.merged_data.shape
+
+
+@pytest.mark.parametrize("damage", ["missing", "truncated"])
+def test_geoparquet_copy_is_recreated(tmp_path, damage):
+    """
+    Verify that the shapefile's GeoParquet copy is rebuilt when it is lost or broken.
+
+    Reasoning
+    ---------
+    On a warm start the zip is only revalidated (304), so nothing is downloaded.
+    The loader itself must still restore a missing or unreadable GeoParquet copy,
+    or every later start would decode the shapefile again.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Built-in pytest fixture providing a temporary directory unique to this test.
+    damage : str
+        Whether the copy is deleted or truncated between the two runs.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    AssertionError
+        If startup fails or the copy is not restored.
+
+    Examples
+    --------
+    >>> pytest -q -k test_geoparquet_copy_is_recreated
+    """
+
+    download_dir = tmp_path / "downloads"
+    sources = [DataSource(url=SHAPEFILE_URL, is_shapefile=True)]
+    files = {SHAPEFILE_URL: _shapefile_zip(tmp_path)}
+    geoparquet = download_dir / "ne_110m_admin_0_countries.parquet"
+
+    with patch(
+        "app.data_handler.requests.Session.get", side_effect=_fake_server(files)
+    ):
+        OkavangoData(sources=sources, download_dir=str(download_dir))
+        assert geoparquet.exists()
+
+        if damage == "missing":
+            geoparquet.unlink()
+        else:
+            geoparquet.write_bytes(b"PAR1 truncated")
+
+        handler = OkavangoData(sources=sources, download_dir=str(download_dir))
+
+    assert sorted(handler.geo_dataframe["ADM0_A3"]) == ["FRA", "USA"]
+    assert sorted(gpd.read_parquet(geoparquet)["ADM0_A3"]) == ["FRA", "USA"]
+
+
+def test_changed_shapefile_columns_rebuild_caches(tmp_path):
+    """
+    Verify that editing `SHAPEFILE_COLUMNS` rebuilds the GeoParquet copy and merged layer.
+
+    Reasoning
+    ---------
+    The zip itself does not change, so neither its mtime nor its ETag can tell the
+    old layer apart: the column list has to invalidate both caches on its own.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Built-in pytest fixture providing a temporary directory unique to this test.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    AssertionError
+        If a layer built for the old column list is still served.
+
+    Examples
+    --------
+    >>> pytest -q -k test_changed_shapefile_columns_rebuild_caches
+    """
+
+    download_dir = tmp_path / "downloads"
+    sources = [
+        DataSource(url=CSV_URL, filename="test.csv"),
+        DataSource(url=SHAPEFILE_URL, is_shapefile=True),
+    ]
+    files = {
+        CSV_URL: b"Entity,Code,Year,Value\nUSA,USA,2023,10\nFRA,FRA,2023,20\n",
+        SHAPEFILE_URL: _shapefile_zip(tmp_path),
+    }
+
+    with patch(
+        "app.data_handler.requests.Session.get", side_effect=_fake_server(files)
+    ):
+        OkavangoData(sources=sources, download_dir=str(download_dir))
+
+        with patch.object(OkavangoData, "SHAPEFILE_COLUMNS", ["ADM0_A3", "NAME"]):
+            handler = OkavangoData(sources=sources, download_dir=str(download_dir))
+
+    geoparquet = gpd.read_parquet(download_dir / "ne_110m_admin_0_countries.parquet")
+    assert "ADMIN" not in geoparquet.columns
+    assert "ADMIN" not in handler.geo_dataframe.columns
+    assert "ADMIN" not in handler.merged_data.columns
+    assert len(_merged_cache_files(download_dir)) == 1
+
+
+def test_changed_csv_rebuilds_caches(tmp_path):
+    """
+    Verify that a re-downloaded CSV invalidates its sidecar and the merged cache.
+
+    Reasoning
+    ---------
+    When the server publishes new data, the new body replaces the CSV (newer
+    mtime, new ETag in the manifest). The stale sidecar must be ignored, the merge
+    must run again, and the outdated `merged_<key>.parquet` must be deleted.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Built-in pytest fixture providing a temporary directory unique to this test.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    AssertionError
+        If stale values are served or the old merged cache survives.
+
+    Examples
+    --------
+    >>> pytest -q -k test_changed_csv_rebuilds_caches
+    """
+
+    download_dir = str(tmp_path / "downloads")
+    sources = [
+        DataSource(url=CSV_URL, filename="test.csv"),
+        DataSource(url=SHAPEFILE_URL, is_shapefile=True),
+    ]
+    files = {
+        CSV_URL: b"Entity,Code,Year,Value\nUSA,USA,2023,10\nFRA,FRA,2023,20\n",
+        SHAPEFILE_URL: _shapefile_zip(tmp_path),
+    }
+
+    with patch(
+        "app.data_handler.requests.Session.get", side_effect=_fake_server(files)
+    ):
+        OkavangoData(sources=sources, download_dir=download_dir)
+        old_cache = _merged_cache_files(download_dir)
+
+        # Make sure the re-downloaded CSV is unambiguously newer than the sidecar.
+        sidecar = os.path.join(download_dir, "test.csv.parquet")
+        os.utime(sidecar, ns=(0, 0))
+
+        files[CSV_URL] = b"Entity,Code,Year,Value\nUSA,USA,2024,11\nFRA,FRA,2024,21\n"
+        handler = OkavangoData(sources=sources, download_dir=download_dir)
+
+    new_cache = _merged_cache_files(download_dir)
+    assert len(new_cache) == 1
+    assert new_cache != old_cache
+
+    assert pd.read_parquet(sidecar)["Value"].to_dict() == {"USA": 11, "FRA": 21}
+    values = handler.merged_data.set_index("ADM0_A3")["Value"]
+    assert values.to_dict() == {"USA": 11, "FRA": 21}
+
+
+def test_changed_sources_rebuild_merged_cache(tmp_path):
+    """
+    Verify that editing the source list forces a new merged layer.
+
+    Reasoning
+    ---------
+    Adding a dataset changes no existing file, so only the source list in the
+    cache key can tell the cached merged layer apart from the one that is needed.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Built-in pytest fixture providing a temporary directory unique to this test.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    AssertionError
+        If the added metric is missing from the merged layer.
+
+    Examples
+    --------
+    >>> pytest -q -k test_changed_sources_rebuild_merged_cache
+    """
+
+    download_dir = str(tmp_path / "downloads")
+    other_url = "https://example.com/other.csv"
+    files = {
+        CSV_URL: b"Entity,Code,Year,Value\nUSA,USA,2023,10\nFRA,FRA,2023,20\n",
+        other_url: b"Entity,Code,Year,Other\nUSA,USA,2023,1\nFRA,FRA,2023,2\n",
+        SHAPEFILE_URL: _shapefile_zip(tmp_path),
+    }
+    sources = [
+        DataSource(url=CSV_URL, filename="test.csv"),
+        DataSource(url=SHAPEFILE_URL, is_shapefile=True),
+    ]
+
+    with patch(
+        "app.data_handler.requests.Session.get", side_effect=_fake_server(files)
+    ):
+        OkavangoData(sources=sources, download_dir=download_dir)
+        old_cache = _merged_cache_files(download_dir)
+
+        sources.insert(1, DataSource(url=other_url, filename="other.csv"))
+        handler = OkavangoData(sources=sources, download_dir=download_dir)
+
+    new_cache = _merged_cache_files(download_dir)
+    assert len(new_cache) == 1
+    assert new_cache != old_cache
+    assert "Other" in handler.merged_data.columns
+
+
+def test_merged_cache_key(tmp_path):
+    """
+    Verify which inputs take part in the merged-layer cache key.
+
+    Reasoning
+    ---------
+    The key must change with the source list, a source's manifest entry, the
+    modification time of a local input, `SHAPEFILE_COLUMNS`, and
+    `SIMPLIFY_TOLERANCE`, while staying
+    stable (so the cache is hit) when none of them changes.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Built-in pytest fixture providing a temporary directory unique to this test.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    AssertionError
+        If an input does not affect the key or an unchanged input does.
+
+    Examples
+    --------
+    >>> pytest -q -k test_merged_cache_key
+    """
+
+    csv_path = tmp_path / "test.csv"
+    csv_path.write_bytes(b"Code,Year,Value\nUSA,2023,10\n")
+    sources = [DataSource(url=CSV_URL, filename="test.csv")]
+
+    handler = OkavangoData(sources=sources, download_dir=str(tmp_path), auto_run=False)
+    key = handler._merged_cache_path()
+
+    assert os.path.basename(key).startswith("merged_")
+    assert handler._merged_cache_path() == key
+
+    handler._manifest[CSV_URL] = {"etag": '"v2"', "size": 29}
+    manifest_key = handler._merged_cache_path()
+    assert manifest_key != key
+
+    os.utime(csv_path, ns=(0, 0))
+    mtime_key = handler._merged_cache_path()
+    assert mtime_key != manifest_key
+
+    with patch.object(OkavangoData, "SIMPLIFY_TOLERANCE", 0.05):
+        assert handler._merged_cache_path() != mtime_key
+
+    with patch.object(OkavangoData, "SHAPEFILE_COLUMNS", ["ADM0_A3", "NAME"]):
+        assert handler._merged_cache_path() != mtime_key
+
+    handler.sources = sources + [DataSource(url=SHAPEFILE_URL, is_shapefile=True)]
+    assert handler._merged_cache_path() != mtime_key
+
+
+def test_write_merged_cache_removes_old_files(tmp_path):
+    """
+    Verify that writing the merged cache deletes outdated `merged_*.parquet` files.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Built-in pytest fixture providing a temporary directory unique to this test.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    AssertionError
+        If an old cache file survives or unrelated files are removed.
+
+    Examples
+    --------
+    >>> pytest -q -k test_write_merged_cache_removes_old_files
+    """
+
+    (tmp_path / "merged_000000000000.parquet").write_bytes(b"stale")
+    (tmp_path / "test.csv.parquet").write_bytes(b"sidecar")
+
+    handler = OkavangoData(sources=[], download_dir=str(tmp_path), auto_run=False)
+    handler.merged_data = gpd.GeoDataFrame(
+        {"ADM0_A3": ["USA"]}, geometry=[Point(0, 0)], crs="EPSG:4326"
+    )
+    path = str(tmp_path / "merged_111111111111.parquet")
+    handler._write_merged_cache(path)
+
+    assert _merged_cache_files(tmp_path) == ["merged_111111111111.parquet"]
+    assert (tmp_path / "test.csv.parquet").exists()
+    assert gpd.read_parquet(path)["ADM0_A3"].tolist() == ["USA"]
+
+
+def test_parquet_sidecar_freshness(tmp_path):
+    """
+    Verify that the cleaned-CSV sidecar is used only while it is not older than the CSV.
+
+    Reasoning
+    ---------
+    The sidecar is trusted when `getmtime(sidecar) >= getmtime(csv)`. To prove it
+    is actually read, the CSV is overwritten with different values but given an
+    older mtime; once the CSV becomes newer, the sidecar must be rebuilt from it.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Built-in pytest fixture providing a temporary directory unique to this test.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    AssertionError
+        If a fresh sidecar is ignored or a stale one is used.
+
+    Examples
+    --------
+    >>> pytest -q -k test_parquet_sidecar_freshness
+    """
+
+    csv_path = tmp_path / "test.csv"
+    sidecar = tmp_path / "test.csv.parquet"
+    csv_path.write_bytes(b"Code,Year,Value\nUSA,2023,10\n")
+
+    def load():
+        handler = OkavangoData(
+            sources=[DataSource(url=CSV_URL, filename="test.csv")],
+            download_dir=str(tmp_path),
+            auto_run=False,
+        )
+        handler._load_and_clean_dataframes()
+        return handler.dataframes["test.csv"]["Value"].to_dict()
+
+    assert load() == {"USA": 10}
+    assert sidecar.exists()
+
+    csv_path.write_bytes(b"Code,Year,Value\nUSA,2023,99\n")
+    os.utime(csv_path, ns=(1, 1))
+    os.utime(sidecar, ns=(2, 2))
+    assert load() == {"USA": 10}
+
+    os.utime(csv_path, ns=(3, 3))
+    assert load() == {"USA": 99}
+    assert pd.read_parquet(sidecar)["Value"].to_dict() == {"USA": 99}
+
+
+def test_unreadable_sidecar_is_rebuilt(tmp_path):
+    """
+    Verify that a truncated Parquet sidecar is treated as a cache miss.
+
+    Reasoning
+    ---------
+    A sidecar cut short is still newer than its CSV. Instead of failing on every
+    start, the loader must rebuild it from the CSV and replace the broken file.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Built-in pytest fixture providing a temporary directory unique to this test.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    AssertionError
+        If loading fails or the sidecar is not repaired.
+
+    Examples
+    --------
+    >>> pytest -q -k test_unreadable_sidecar_is_rebuilt
+    """
+
+    csv_path = tmp_path / "test.csv"
+    sidecar = tmp_path / "test.csv.parquet"
+    csv_path.write_bytes(b"Code,Year,Value\nUSA,2023,10\n")
+    sidecar.write_bytes(b"PAR1 truncated")
+    os.utime(csv_path, ns=(1, 1))
+
+    handler = OkavangoData(
+        sources=[DataSource(url=CSV_URL, filename="test.csv")],
+        download_dir=str(tmp_path),
+        auto_run=False,
+    )
+    handler._load_and_clean_dataframes()
+
+    assert handler.dataframes["test.csv"]["Value"].to_dict() == {"USA": 10}
+    assert pd.read_parquet(sidecar)["Value"].to_dict() == {"USA": 10}
+    assert not (tmp_path / "test.csv.parquet.tmp").exists()
+
+
+def test_annotation_columns_not_loaded(tmp_path):
+    """
+    Verify that free-text OWID annotation columns are projected away at parse time.
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Built-in pytest fixture providing a temporary directory unique to this test.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    AssertionError
+        If an annotation column is parsed or the metric column is lost.
+
+    Examples
+    --------
+    >>> pytest -q -k test_annotation_columns_not_loaded
+    """
+
+    (tmp_path / "test.csv").write_bytes(
+        b"Entity,Code,Year,Value,Value (annotations)\n"
+        b"United States,USA,2023,10,Provisional estimate\n"
+    )
+    handler = OkavangoData(
+        sources=[DataSource(url=CSV_URL, filename="test.csv")],
+        download_dir=str(tmp_path),
+        auto_run=False,
+    )
+
+    with patch("app.data_handler.pd.read_csv", wraps=pd.read_csv) as read_csv:
+        handler._load_and_clean_dataframes()
+
+    parse_call = read_csv.call_args_list[-1]
+    assert "Value (annotations)" not in parse_call.kwargs["usecols"]
+    assert list(handler.dataframes["test.csv"].columns) == ["Value"]
+
+
+def test_select_extremes_ordering():
+    """
+    Verify the top/bottom selection behind the dashboard's extremes bar chart.
+
+    Reasoning
+    ---------
+    `select_extremes` uses a partial `np.argpartition` instead of full sorts, so
+    the result must still match a full sort: the largest values in descending
+    order, the smallest in ascending order, with missing values ignored.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    AssertionError
+        If the wrong rows are selected or they are out of order.
+
+    Examples
+    --------
+    >>> pytest -q -k test_select_extremes_ordering
+    """
+
+    values = [7.0, None, 3.0, 12.0, -1.0, 5.0, 9.0, 0.5, 4.0, 11.0, None, 2.0, 8.0]
+    data = pd.DataFrame(
+        {"Value": values},
+        index=[f"C{i:02d}" for i in range(len(values))],
+    ).astype("float32")
+
+    top, bottom = select_extremes(data, "Value", n=5)
+
+    assert top["Value"].tolist() == [12.0, 11.0, 9.0, 8.0, 7.0]
+    assert bottom["Value"].tolist() == [-1.0, 0.5, 2.0, 3.0, 4.0]
+    assert top.index.tolist() == ["C03", "C09", "C06", "C12", "C00"]
+
+    small_top, small_bottom = select_extremes(data.iloc[:3], "Value", n=5)
+    assert small_top["Value"].tolist() == [7.0, 3.0]
+    assert small_bottom["Value"].tolist() == [3.0, 7.0]
+
+    top, bottom = select_extremes(data, "Value", n=0)
+    assert top.empty and bottom.empty
+
+
+def test_select_extremes_ties():
+    """
+    Verify that tied values resolve like `nlargest`/`nsmallest` (first rows win).
+
+    Reasoning
+    ---------
+    Real indicators tie, e.g. several countries with 0% forest cover at the bottom.
+    The partition-based selection must pick and order tied rows in frame order,
+    exactly as the full-sort `nlargest`/`nsmallest` reference does.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    AssertionError
+        If tied rows are selected or ordered differently from the reference.
+
+    Examples
+    --------
+    >>> pytest -q -k test_select_extremes_ties
+    """
+
+    data = pd.DataFrame(
+        {"Value": [5, 5, 5, 5, 5, 5, 5, 1]},
+        index=list("abcdefgh"),
+    ).astype("float32")
+
+    top, bottom = select_extremes(data, "Value", n=5)
+
+    assert top.index.tolist() == list("abcde")
+    assert bottom.index.tolist() == list("habcd")
+    pd.testing.assert_frame_equal(top, data.nlargest(5, "Value"))
+    pd.testing.assert_frame_equal(bottom, data.nsmallest(5, "Value"))